@@ -0,0 +1,34 @@
+"""
+Gunicorn configuration for FC Zürich Stats
+Used by the Docker image: gunicorn -c gunicorn.conf.py app:app
+"""
+
+import os
+
+bind = '0.0.0.0:5000'
+
+
+def _default_workers():
+    """
+    Without Redis every worker has its own cache and fetches API-Football on
+    its own, so stay at 2 workers to protect the daily request quota.
+    With a shared Redis cache, scale with the CPUs available to this process.
+    """
+    if not os.environ.get('REDIS_URL'):
+        return 2
+    if hasattr(os, 'sched_getaffinity'):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    return min(cpus * 2 + 1, 8)
+
+
+# Several workers with threads each, so requests waiting on API-Football
+# don't block other visitors
+workers = int(os.environ.get('WEB_CONCURRENCY', _default_workers()))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+
+# Keep connections from a reverse proxy open between requests
+keepalive = 5
+timeout = 30